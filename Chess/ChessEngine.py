@@ -12,6 +12,8 @@ Inspiration: Eddie Sharick (Youtube)
 
 # importing the numpy class so that you may use a numpy array
 import numpy as np
+# Precomputed targets and rays for every square
+from MoveTables import knightMoves, kingMoves, pawnAttacks, rookRays, bishopRays, betweenSquares, lineSquares
 
 # Storing each row as its own list so that it is easier to access later on
 blankRow = ["--", "--", "--", "--", "--", "--", "--", "--"]
@@ -161,10 +163,14 @@ class GameState():
         self.currentCastlingRight.whiteQueenSide, self.currentCastlingRight.blackQueenSide)
         moves = self.getAllMoves()
         if self.whiteToMove:
-            self.getCastleMoves(self.wKingLoc[0], self.wKingLoc[1], moves)
+            kingRow, kingColo = self.wKingLoc
         else:
-            self.getCastleMoves(self.bKingLoc[0], self.bKingLoc[1], moves)
+            kingRow, kingColo = self.bKingLoc
+        self.getCastleMoves(kingRow, kingColo, moves)
+        inCheck = self.inCheck()
         for i in range(len(moves)-1, -1, -1): # When removing from a list it is best to start from the back that way you will not have issues with the index
+            if not inCheck and not self.mayExposeKing(moves[i], kingRow, kingColo):
+                continue # The move can not leave the king in check so there is no need to test it
             self.makeMove(moves[i])
             self.whiteToMove = not self.whiteToMove
             if self.inCheck():
@@ -172,7 +178,7 @@ class GameState():
             self.whiteToMove = not self.whiteToMove
             self.undoMove()
         if len(moves) == 0: # In this case it would either be a checkmate or stalemate
-            if self.inCheck():
+            if inCheck:
                 self.checkMate = True
             else:
                 self.staleMate = True
@@ -183,6 +189,23 @@ class GameState():
         self.currentCastlingRight = tempCastleRights # Resetting the castle rights
         return moves
 
+    # Checks if a move made while not in check could leave the king open to attack
+    # Only king moves, en passant and moves by a piece that may be pinned need to be tested
+    def mayExposeKing(self, move, kingRow, kingColo):
+        if move.pieceMoved[1] == 'K' or move.isEnPassant:
+            return True
+        kingSquare = kingRow * 8 + kingColo
+        startSquare = move.startRow * 8 + move.startColo
+        line = lineSquares[kingSquare][startSquare]
+        if not line: # The piece does not share a line with the king so it can not be pinned
+            return False
+        if (move.endRow, move.endColo) in line: # Moving along the pin line keeps the king covered
+            return False
+        for spot in betweenSquares[kingSquare][startSquare]:
+            if self.board[spot] != "--": # Another piece is already blocking the line
+                return False
+        return True
+
     # Checks for when a player is in check
     def inCheck(self):
         if self.whiteToMove:
@@ -191,13 +214,27 @@ class GameState():
             return self.underAttack(self.bKingLoc[0], self.bKingLoc[1])
 
     # Checks if the enemy can attack the square at the given coordinate (r, c)
+    # Looks outward from the square using the move tables instead of generating every enemy move
     def underAttack(self, r, c):
-        self.whiteToMove = not self.whiteToMove # Switching to the opponents point of view
-        oppMoves = self.getAllMoves()
-        self.whiteToMove = not self.whiteToMove # Switching turns back
-        for oppMove in oppMoves:
-            if oppMove.endRow == r and oppMove.endColo == c: # The given square is in danger
+        allyColor = 'w' if self.whiteToMove else 'b'
+        enemy = 'b' if self.whiteToMove else 'w'
+        for spot in knightMoves[r][c]:
+            if self.board[spot] == enemy + 'N':
+                return True
+        for spot in kingMoves[r][c]:
+            if self.board[spot] == enemy + 'K':
+                return True
+        for spot in pawnAttacks[allyColor][r][c]: # An enemy pawn attacks this square from the squares our own pawn would attack
+            if self.board[spot] == enemy + 'p':
                 return True
+        for rays, sliders in ((rookRays[r][c], 'RQ'), (bishopRays[r][c], 'BQ')):
+            for ray in rays:
+                for spot in ray:
+                    piece = self.board[spot]
+                    if piece != "--": # The first piece on the ray blocks everything behind it
+                        if piece[0] == enemy and piece[1] in sliders:
+                            return True
+                        break
         return False
 
     # All possible moves (checks not included) *getAllMoves == getAllPossibleMoves*
@@ -257,147 +294,39 @@ class GameState():
     '''
     Generates all of the possible rook moves of the given rook and adds it to a list
     '''
-    def getRookMoves(self, row, colo, moves): # *May possibly revise to a shorter solution similar to bishop moves*
-        # White Rook moves
-        if self.whiteToMove: # If it is white's turn
-            # Start adding possible forward moves
-            forwardCount = row - 1 # Start from the first square ahead
-            while forwardCount >= 0: # Making sure it does not go off the board
-                if self.board[forwardCount][colo][0] == 'b': # If the piece in that coordinate is black
-                    moves.append(Move((row, colo), (forwardCount, colo), self.board))
-                    break # The rook can not go past the black piece
-                elif self.board[forwardCount][colo][0] == 'w': # If the piece in that coordinate is white
-                    break
-                else:
-                    moves.append(Move((row, colo), (forwardCount, colo), self.board))
-                forwardCount = forwardCount - 1
-            # Start adding possible backward moves
-            backwardCount = row + 1 # Start from the first square behind
-            while backwardCount <= 7: # Making sure it does not go off the board
-                if self.board[backwardCount][colo][0] == 'b': # If the piece is black
-                    moves.append(Move((row, colo), (backwardCount, colo), self.board))
-                    break
-                elif self.board[backwardCount][colo][0] == 'w': # If the piece in that coordinate is white
-                    break
-                else: 
-                    moves.append(Move((row, colo), (backwardCount, colo), self.board))
-                backwardCount = backwardCount + 1
-            # Start adding possible moves to the left
-            leftCount = colo - 1
-            while leftCount >= 0: # Making sure the piece does not go off the board
-                if self.board[row][leftCount][0] == 'b': # If the piece is black
-                    moves.append(Move((row, colo), (row, leftCount), self.board))
-                    break
-                elif self.board[row][leftCount][0] == 'w': # If the piece is white
-                    break
-                else:
-                    moves.append((Move((row, colo), (row, leftCount), self.board)))
-                leftCount = leftCount - 1
-            # Start adding possible moves to the right
-            rightCount = colo + 1
-            while rightCount <= 7: # Making sure the piece does not go off the board
-                if self.board[row][rightCount][0] == 'b': # If the piece is black
-                    moves.append(Move((row, colo), (row, rightCount), self.board))
-                    break
-                elif self.board[row][rightCount][0] == 'w': # If the piece is white
-                    break
-                else:
-                    moves.append(Move((row, colo), (row, rightCount), self.board))
-                rightCount = rightCount + 1
-        else: # If it is not white's turn it is black's turn
-            # Start adding possible forward moves
-            forwardCount = row + 1 # Start from the first square ahead
-            while forwardCount <= 7: # Making sure it does not go off the board
-                if self.board[forwardCount][colo][0] == 'w': # If the piece in that coordinate is white
-                    moves.append(Move((row, colo), (forwardCount, colo), self.board))
-                    break # The rook can not go past the white piece
-                elif self.board[forwardCount][colo][0] == 'b': # If the piece in that coordinate is black
-                    break
-                else:
-                    moves.append(Move((row, colo), (forwardCount, colo), self.board))
-                forwardCount = forwardCount + 1
-            # Start adding possible backward moves
-            backwardCount = row - 1 # Start from the first square behind
-            while backwardCount >= 0: # Making sure it does not go off the board
-                if self.board[backwardCount][colo][0] == 'w': # If the piece is white
-                    moves.append(Move((row, colo), (backwardCount, colo), self.board))
-                    break
-                elif self.board[backwardCount][colo][0] == 'b': # If the piece in that coordinate is black
-                    break
-                else: 
-                    moves.append(Move((row, colo), (backwardCount, colo), self.board))
-                backwardCount = backwardCount - 1
-            # Start adding possible moves to black's left
-            leftCount = colo + 1
-            while leftCount <= 7: # Making sure the piece does not go off the board
-                if self.board[row][leftCount][0] == 'w': # If the piece is white
-                    moves.append(Move((row, colo), (row, leftCount), self.board))
-                    break
-                elif self.board[row][leftCount][0] == 'b': # If the piece is black
-                    break
-                else:
-                    moves.append((Move((row, colo), (row, leftCount), self.board)))
-                leftCount = leftCount + 1
-            # Start adding possible moves to black's right
-            rightCount = colo - 1
-            while rightCount >= 0: # Making sure the piece does not go off the board
-                if self.board[row][rightCount][0] == 'w': # If the piece is white
-                    moves.append(Move((row, colo), (row, rightCount), self.board))
-                    break
-                elif self.board[row][rightCount][0] == 'b': # If the piece is black
-                    break
-                else:
-                    moves.append(Move((row, colo), (row, rightCount), self.board))
-                rightCount = rightCount - 1
+    def getRookMoves(self, row, colo, moves):
+        self.getSlidingMoves(row, colo, rookRays[row][colo], moves)
+
     '''            
     Generates all of the possible Knight moves of the given Knight and adds it to a list
     '''
     def getKnightMoves(self, row, colo, moves):
-        spots = [
-            (row - 2, colo + 1),
-            (row - 1, colo + 2),
-            (row + 1, colo + 2),
-            (row + 2, colo + 1),
-            (row - 2, colo - 1),
-            (row - 1, colo - 2),
-            (row + 1, colo - 2),
-            (row + 2, colo - 1),
-        ]
-        if self.whiteToMove: # If it is white's turn
-            for spot in spots:
-                if 0 <= spot[0] < 8 and 0 <= spot[1] < 8: # If the coordinate is on the board
-                    if self.board[spot][0] != 'w': # If there is not a white piece at that coordinate
-                        moves.append(Move((row, colo), spot, self.board))
-        else: # If it is not white's turn it is black's turn
-            for spot in spots:
-                if 0 <= spot[0] < 8 and 0 <= spot[1] < 8: # If the coordinate is on the board
-                    if self.board[spot][0] != 'b': # If there is not a black piece at that coordinate
-                        moves.append(Move((row, colo), spot, self.board))
+        allyColor = 'w' if self.whiteToMove else 'b'
+        for spot in knightMoves[row][colo]: # Only the squares that are on the board
+            if self.board[spot][0] != allyColor: # If there is not an ally piece at that coordinate
+                moves.append(Move((row, colo), spot, self.board))
 
     '''
     Generates all of the possible Bishop moves of the given Bishop and adds it to a list
     '''
     def getBishopMoves(self, row, colo, moves):
-        directions = ((-1, -1), (-1, 1), (1, -1), (1, 1)) # 4 diagonals
+        self.getSlidingMoves(row, colo, bishopRays[row][colo], moves)
+
+    '''
+    Walks along each of the given rays until the piece runs into another piece
+    '''
+    def getSlidingMoves(self, row, colo, rays, moves):
         enemy = 'b' if self.whiteToMove else 'w'
-        for direction in directions:
-            for i in range(1, 8):
-                endRow = row + direction[0] * i
-                endColo = colo + direction[1] * i
-                if 0 <= endRow < 8 and 0 <= endColo < 8: # Staying on the board
-                    endPiece = self.board[endRow][endColo]
-                    if endPiece == "--": # Theres an empty space
-                        moves.append(Move((row, colo), (endRow, endColo), self.board))
-                    elif endPiece[0] == enemy: # Opposite color
-                        moves.append(Move((row, colo), (endRow, endColo), self.board))
-                        break
-                    else: # Cant skip over an ally piece
-                        break
-                else: # That spot is off the board
+        for ray in rays:
+            for spot in ray: # Closest square first, the ray already stops at the edge of the board
+                endPiece = self.board[spot]
+                if endPiece == "--": # Theres an empty space
+                    moves.append(Move((row, colo), spot, self.board))
+                elif endPiece[0] == enemy: # Opposite color
+                    moves.append(Move((row, colo), spot, self.board))
+                    break
+                else: # Cant skip over an ally piece
                     break
-
-
-            
 
     '''
     Generates all of the possible Queen moves of the given Queen and adds it to a list
@@ -410,28 +339,10 @@ class GameState():
     Generates all of the possible King moves of the given King and adds it to a list
     '''
     def getKingMoves(self, row, colo, moves):
-        spots = [ 
-            (row - 1, colo - 1),
-            (row - 1, colo),
-            (row - 1, colo + 1),
-            (row, colo - 1),
-            (row, colo + 1),
-            (row + 1, colo - 1),
-            (row + 1, colo),
-            (row + 1, colo + 1),
-        ]
-        allyColor = 'w'
-        if self.whiteToMove: # If it is white's turn
-            for spot in spots:
-                if 0 <= spot[0] < 8 and 0 <= spot[1] < 8: # If the coordinate is on the board
-                    if self.board[spot][0] != 'w': # If there is not a white piece at that coordinate
-                        moves.append(Move((row, colo), spot, self.board))
-        else: # If it is not white's turn it is black's turn
-            allyColor = 'b'
-            for spot in spots:
-                if 0 <= spot[0] < 8 and 0 <= spot[1] < 8: # If the coordinate is on the board
-                    if self.board[spot][0] != 'b': # If there is not a black piece at that coordinate
-                        moves.append(Move((row, colo), spot, self.board))
+        allyColor = 'w' if self.whiteToMove else 'b'
+        for spot in kingMoves[row][colo]: # Only the squares that are on the board
+            if self.board[spot][0] != allyColor: # If there is not an ally piece at that coordinate
+                moves.append(Move((row, colo), spot, self.board))
         
 
     # Generates all valid castle moves for the king
@@ -464,6 +375,71 @@ class CastleRights():
         self.whiteQueenSide = wqs
         self.blackQueenSide = bqs
 
+# A compact copy of everything needed to rebuild the game at a given ply
+class Snapshot():
+    def __init__(self, gameState):
+        self.ply = len(gameState.moveLog) # Number of moves made when the snapshot was taken
+        self.board = gameState.board.copy()
+        self.whiteToMove = gameState.whiteToMove
+        self.castleRights = CastleRights(gameState.currentCastlingRight.whiteKingSide, gameState.currentCastlingRight.blackKingSide,
+        gameState.currentCastlingRight.whiteQueenSide, gameState.currentCastlingRight.blackQueenSide)
+        self.enpassantPossible = gameState.enpassantPossible
+        self.wKingLoc = gameState.wKingLoc
+        self.bKingLoc = gameState.bKingLoc
+
+    # Puts the game state back to the position the snapshot was taken in
+    # The move and castle right logs are cut from the full history so the moves can still be undone
+    def restore(self, gameState, moves, castleRights):
+        gameState.board = self.board.copy() # Copying so that the snapshot is not changed by later moves
+        gameState.whiteToMove = self.whiteToMove
+        gameState.currentCastlingRight = CastleRights(self.castleRights.whiteKingSide, self.castleRights.blackKingSide,
+        self.castleRights.whiteQueenSide, self.castleRights.blackQueenSide)
+        gameState.enpassantPossible = self.enpassantPossible
+        gameState.wKingLoc = self.wKingLoc
+        gameState.bKingLoc = self.bKingLoc
+        gameState.moveLog = moves[:self.ply]
+        gameState.castleRightLog = castleRights[:self.ply + 1]
+        gameState.checkMate = False # Both of these are worked out again by getValidMoves
+        gameState.staleMate = False
+
+# Keeps every move of the game along with a snapshot every few plies so that any ply can be reached
+# by restoring the closest snapshot and replaying at most snapshotInterval moves
+# Should be created at the start of the game and told about every move that is actually played
+class GameHistory():
+    def __init__(self, gameState, snapshotInterval=8):
+        self.snapshotInterval = snapshotInterval # Smaller values jump faster but keep more snapshots in memory
+        self.moves = [] # Every move played, including the ones after the ply currently being viewed
+        self.castleRights = [gameState.castleRightLog[-1]] # Castle rights after each ply
+        self.snapshots = [Snapshot(gameState)] # snapshots[i] is the position after i * snapshotInterval plies
+
+    # Number of plies in the stored game
+    def lastPly(self):
+        return len(self.moves)
+
+    # Saves the move that was just made on the game state
+    # Making a move while looking at an earlier ply replaces the rest of the game
+    def recordMove(self, gameState):
+        ply = len(gameState.moveLog)
+        self.truncate(ply - 1)
+        self.moves.append(gameState.moveLog[-1])
+        self.castleRights.append(gameState.castleRightLog[-1])
+        if ply % self.snapshotInterval == 0:
+            self.snapshots.append(Snapshot(gameState))
+
+    # Forgets every move after the given ply (used when a move is undone)
+    def truncate(self, ply):
+        del self.moves[ply:]
+        del self.castleRights[ply + 1:]
+        del self.snapshots[ply // self.snapshotInterval + 1:]
+
+    # Sets the game state to the position after the given number of plies
+    def jumpToPly(self, gameState, ply):
+        ply = max(0, min(ply, self.lastPly())) # Staying inside the game
+        snapshot = self.snapshots[ply // self.snapshotInterval] # Closest snapshot at or before the ply
+        snapshot.restore(gameState, self.moves, self.castleRights)
+        for i in range(snapshot.ply, ply): # Replaying the moves after the snapshot
+            gameState.makeMove(self.moves[i])
+
 class Move():
     # maps keys to values
     # key : value
@@ -507,4 +483,4 @@ class Move():
 
 
     
-        
\ No newline at end of file
+        
\ No newline at end of file
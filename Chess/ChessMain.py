@@ -12,12 +12,15 @@ Inspiration: Eddie Sharick (Youtube)
 import pygame as p
 from ChessEngine import GameState
 from ChessEngine import Move
+from ChessEngine import GameHistory
 
 WIDTH = HEIGHT = 512 #400 is another good option
 DIMENSION = 8 #Chess board is 8x8
 SQ_SIZE = HEIGHT // DIMENSION # Double division sign gives your answer in integers
 MAX_FPS = 15 # For animations 
 IMAGES ={}
+SNAPSHOT_INTERVAL = 8 # Plies between game snapshots (smaller is faster to seek but uses more memory)
+SEEK_STEP = 10 # Plies skipped by the up and down arrow keys
 
 '''
 Will initialize a global dictionary of images. This will be called exactly once in the main
@@ -39,6 +42,7 @@ def main():
     clock = p.time.Clock() 
     screen.fill(p.Color("white")) # Background color
     gameState = GameState() 
+    history = GameHistory(gameState, SNAPSHOT_INTERVAL) # Lets the user step back and forth through the game
     validMoves = gameState.getValidMoves() # This statement decreases our efficiency which is why we have the statement following
     moveMade = False # Flag variable for when the move is made
     animate = False # Boolean that determines whether or not a move should be animated
@@ -68,6 +72,7 @@ def main():
                         for i in range(len(validMoves)):
                             if move == validMoves[i]: # Only make the move if the move is a valid move
                                 gameState.makeMove(validMoves[i])
+                                history.recordMove(gameState) # Replaces the rest of the game if an earlier ply was being viewed
                                 print(move.getChessNotation())
                                 moveMade = True
                                 animate = True
@@ -79,11 +84,30 @@ def main():
             elif e.type == p.KEYDOWN:
                 if e.key == p.K_u: # Undo the move when 'u' is pressed
                     gameState.undoMove()
+                    history.truncate(len(gameState.moveLog)) # The undone move is taken out of the game history
                     moveMade = True
                     animate = False
                     gameOver = False
+                # Moving through the game history with the arrow, home and end keys
+                seekKeys = {
+                    p.K_LEFT : len(gameState.moveLog) - 1,
+                    p.K_RIGHT : len(gameState.moveLog) + 1,
+                    p.K_DOWN : len(gameState.moveLog) - SEEK_STEP,
+                    p.K_UP : len(gameState.moveLog) + SEEK_STEP,
+                    p.K_HOME : 0,
+                    p.K_END : history.lastPly()
+                }
+                if e.key in seekKeys:
+                    targetPly = seekKeys[e.key]
+                    animate = targetPly == len(gameState.moveLog) + 1 and targetPly <= history.lastPly() # Only animate a single step forward
+                    history.jumpToPly(gameState, targetPly)
+                    squareSelected = ()
+                    playerClicks = []
+                    moveMade = True
+                    gameOver = False
                 if e.key == p.K_r: # Reset the board when the user presses 'r'
                     gameState = GameState()
+                    history = GameHistory(gameState, SNAPSHOT_INTERVAL)
                     validMoves = gameState.getValidMoves
                     squareSelected = ()
                     playerClicks = []
@@ -0,0 +1,85 @@
+'''
+Name: Caleb Appiagyei
+
+Date: 10/19/26
+
+Description: Runs the mate solver on a fixed set of puzzles and prints how long
+each one took and how many positions were searched. Run it from the Chess folder
+with "python MateBenchmark.py"
+
+Inspiration: Eddie Sharick (Youtube)
+'''
+
+import time
+import numpy as np
+from ChessEngine import GameState
+from ChessEngine import CastleRights
+from MateSolver import MateSolver, MATE, UNKNOWN
+
+# (name, FEN, moves to search, expected mate length or None when there is no mate within that many moves)
+PUZZLES = [
+    ("Back rank", "6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1", 2, 1),
+    ("Black back rank", "r5k1/8/8/8/8/8/5PPP/6K1 b - - 0 1", 2, 1),
+    ("Smothered mate", "6rk/6pp/8/6N1/8/8/1Q6/6K1 w - - 0 1", 3, 1),
+    ("Queen avoids stalemate", "k7/2Q5/1K6/8/8/8/8/8 w - - 0 1", 2, 1),
+    ("Rook sacrifice", "r5k1/5ppp/8/8/8/8/4RPPP/4R1K1 w - - 0 1", 3, 2),
+    ("Opera game", "4kb1r/p2n1ppp/4q3/4p1B1/4P3/1Q6/PPP2PPP/2KR4 w k - 1 16", 3, 2),
+    ("Philidor's legacy", "r6k/6pp/8/6N1/2Q5/8/8/6K1 w - - 0 1", 6, 4),
+    ("Covered back rank", "6k1/5ppp/8/8/8/8/5PPP/6K1 w - - 0 1", 3, None),
+    ("Rook ladder", "6k1/8/8/8/8/8/1R6/R5K1 w - - 0 1", 4, None),
+    ("Long rook ladder", "8/8/6k1/8/8/8/R7/1R4K1 w - - 0 1", 5, None),
+]
+
+'''
+Sets up a GameState from a FEN string (only the pieces, turn, castling and en passant fields are used)
+'''
+def loadFen(fen):
+    fields = fen.split()
+    gameState = GameState()
+    rows = []
+    for row, rank in enumerate(fields[0].split('/')):
+        boardRow = []
+        for char in rank:
+            if char.isdigit(): # A number of empty squares
+                boardRow.extend(["--"] * int(char))
+            else:
+                color = 'w' if char.isupper() else 'b'
+                piece = 'p' if char.lower() == 'p' else char.upper()
+                if piece == 'K': # Keeping track of the kings
+                    if color == 'w':
+                        gameState.wKingLoc = (row, len(boardRow))
+                    else:
+                        gameState.bKingLoc = (row, len(boardRow))
+                boardRow.append(color + piece)
+        rows.append(boardRow)
+    gameState.board = np.array(rows)
+    gameState.whiteToMove = fields[1] == 'w'
+    castling = fields[2] if len(fields) > 2 else '-'
+    gameState.currentCastlingRight = CastleRights('K' in castling, 'k' in castling, 'Q' in castling, 'q' in castling)
+    gameState.castleRightLog = [CastleRights('K' in castling, 'k' in castling, 'Q' in castling, 'q' in castling)]
+    if len(fields) > 3 and fields[3] != '-': # En passant square in rank-file notation
+        gameState.enpassantPossible = (8 - int(fields[3][1]), ord(fields[3][0]) - ord('a'))
+    return gameState
+
+'''
+Solves every puzzle and prints the results along with the totals
+'''
+def main():
+    totalNodes = 0
+    failed = 0
+    startTime = time.perf_counter()
+    for name, fen, maxMoves, expected in PUZZLES:
+        result = MateSolver(loadFen(fen)).solve(maxMoves)
+        found = result.mateIn() if result.status == MATE else None
+        correct = found == expected and result.status != UNKNOWN
+        totalNodes += result.nodes
+        if not correct:
+            failed += 1
+        print(name.ljust(24) + str(result.nodes).rjust(8) + " nodes " + ("%.3f" % result.seconds).rjust(8) + "s  "
+            + ("ok    " if correct else "WRONG ") + str(result))
+    print(str(len(PUZZLES)) + " puzzles, " + str(failed) + " wrong, " + str(totalNodes) + " nodes, "
+        + "%.3f" % (time.perf_counter() - startTime) + "s")
+
+# Allows you to use main if it is imported later
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+'''
+Name: Caleb Appiagyei
+
+Date: 10/19/26
+
+Description: Finds forced checkmates for puzzle positions. Uses proof-number
+search on top of the GameState instead of a full alpha-beta search. The side
+to move is the attacker and by default only checking moves are tried on the
+attacker's turn, while every reply is tried on the defender's turn
+
+Inspiration: Eddie Sharick (Youtube)
+'''
+
+import time
+
+INFINITY = float('inf')
+# Possible results of a search
+MATE = 'mate'
+NO_MATE = 'no mate'
+UNKNOWN = 'unknown' # The node or time limit ran out before the search finished
+
+# A single position in the search tree, reached by playing move from the parent position
+# Even plies are the attacker's turn (one child needs to be a mate) and odd plies are
+# the defender's turn (every child needs to be a mate)
+class PNNode():
+    def __init__(self, move, parent, ply):
+        self.move = move
+        self.parent = parent
+        self.ply = ply
+        self.children = []
+        self.replies = None # The defender's valid moves, kept from when the position was first looked at
+        self.expanded = False
+        # Proof number: how many more positions need to be proven before this one is a mate
+        # Disproof number: how many more positions need to be disproven before this one is not
+        self.proof = 1
+        self.disproof = 1
+
+    def isAttackerTurn(self):
+        return self.ply % 2 == 0
+
+# What the solver found for a position
+class MateResult():
+    def __init__(self, status, maxMoves, line, nodes, seconds):
+        self.status = status
+        self.maxMoves = maxMoves
+        self.line = line # The moves of the mate (attacker and defender moves) when one was found
+        self.nodes = nodes # Positions added to the search tree
+        self.seconds = seconds
+
+    # Number of attacker moves needed to mate
+    def mateIn(self):
+        return (len(self.line) + 1) // 2
+
+    def __str__(self):
+        if self.status == MATE:
+            return "Mate in " + str(self.mateIn()) + ": " + ", ".join(move.getChessNotation() for move in self.line)
+        elif self.status == NO_MATE:
+            return "No mate within " + str(self.maxMoves)
+        return "No answer within the node or time limit"
+
+class MateSolver():
+    # maxNodes bounds the size of the search tree and timeLimit is in seconds
+    # With checksOnly the attacker only tries checking moves, so quiet mates will not be found
+    def __init__(self, gameState, maxNodes=200000, timeLimit=10.0, checksOnly=True):
+        self.gameState = gameState
+        self.maxNodes = maxNodes
+        self.timeLimit = timeLimit
+        self.checksOnly = checksOnly
+        self.nodeCount = 0
+        self.enpassantLog = [] # undoMove does not bring back the en passant square so it is kept here
+
+    # Looks for a mate in at most maxMoves attacker moves
+    # Tries mate in 1, then mate in 2 and so on so that the shortest mate is the one returned
+    # The game state is left in the same position it started in
+    def solve(self, maxMoves):
+        startTime = time.perf_counter()
+        deadline = startTime + self.timeLimit
+        self.nodeCount = 0
+        checkMate, staleMate = self.gameState.checkMate, self.gameState.staleMate
+        status, line = NO_MATE, []
+        for depth in range(1, maxMoves + 1):
+            root = self.search(depth, deadline)
+            if root.proof == 0:
+                status, line = MATE, self.getLine(root)
+                break
+            if root.disproof != 0: # Neither proven nor disproven so a limit was reached
+                status = UNKNOWN
+                break
+        self.gameState.checkMate, self.gameState.staleMate = checkMate, staleMate # getValidMoves changes these while searching
+        return MateResult(status, maxMoves, line, self.nodeCount, time.perf_counter() - startTime)
+
+    # Proof-number search for a mate in exactly depth attacker moves or fewer
+    def search(self, depth, deadline):
+        root = PNNode(None, None, 0)
+        while root.proof != 0 and root.disproof != 0:
+            if self.nodeCount >= self.maxNodes or time.perf_counter() > deadline:
+                break
+            node = self.selectMostProving(root)
+            self.expand(node, depth)
+            self.updateAncestors(node)
+        return root
+
+    # Walks down from the root to the unexpanded position that would help the most to solve
+    # Makes the moves along the way so the game state ends up in that position
+    def selectMostProving(self, node):
+        while node.expanded:
+            if node.isAttackerTurn(): # Easiest child to prove
+                node = min(node.children, key=lambda child: child.proof)
+            else: # Easiest child to disprove
+                node = min(node.children, key=lambda child: child.disproof)
+            self.makeMove(node.move)
+        return node
+
+    # Generates the children of the position the game state is currently in
+    def expand(self, node, depth):
+        node.expanded = True
+        if node.isAttackerTurn():
+            moves = self.gameState.getValidMoves()
+            if self.gameState.checkMate or self.gameState.staleMate: # The attacker got mated or it is a draw
+                node.proof, node.disproof = INFINITY, 0
+                return
+            for move in moves:
+                self.makeMove(move)
+                if not self.checksOnly or self.gameState.inCheck(): # It is now the defender's turn so this checks their king
+                    node.children.append(self.createDefenderNode(move, node, depth))
+                self.undoMove()
+        else:
+            for move in node.replies:
+                node.children.append(PNNode(move, node, node.ply + 1))
+            node.replies = None # No longer needed once the children are made
+        self.nodeCount += len(node.children)
+        self.setProofNumbers(node)
+
+    # Creates the node for the position after an attacker move (the game state has to be in that position)
+    # Mates, draws and positions after the last allowed attacker move are solved right away
+    def createDefenderNode(self, move, parent, depth):
+        node = PNNode(move, parent, parent.ply + 1)
+        node.replies = self.gameState.getValidMoves()
+        if self.gameState.checkMate:
+            node.expanded = True
+            node.proof, node.disproof = 0, INFINITY
+        elif self.gameState.staleMate or node.ply == 2 * depth - 1: # Drawn or out of moves
+            node.expanded = True
+            node.proof, node.disproof = INFINITY, 0
+            node.replies = None
+        else:
+            node.proof = len(node.replies) # Every reply has to be proven so fewer replies means an easier proof
+        return node
+
+    # Works out the proof and disproof numbers of an expanded position from its children
+    def setProofNumbers(self, node):
+        if node.isAttackerTurn(): # Only one move needs to mate (no children means there were no checks)
+            node.proof = min((child.proof for child in node.children), default=INFINITY)
+            node.disproof = sum(child.disproof for child in node.children)
+        else: # Every reply needs to get mated
+            node.proof = sum(child.proof for child in node.children)
+            node.disproof = min(child.disproof for child in node.children)
+
+    # Updates the numbers of every position from the expanded one back up to the root
+    # Undoes the moves on the way so the game state ends up back at the root
+    def updateAncestors(self, node):
+        while node.parent is not None:
+            self.undoMove()
+            node = node.parent
+            self.setProofNumbers(node)
+
+    def makeMove(self, move):
+        self.enpassantLog.append(self.gameState.enpassantPossible)
+        self.gameState.makeMove(move)
+
+    def undoMove(self):
+        self.gameState.undoMove()
+        self.gameState.enpassantPossible = self.enpassantLog.pop()
+
+    # Number of attacker moves until mate from a proven position
+    def mateLength(self, node):
+        if not node.children: # The defender is checkmated
+            return 0
+        if node.isAttackerTurn():
+            return 1 + min(self.mateLength(child) for child in node.children if child.proof == 0)
+        return max(self.mateLength(child) for child in node.children)
+
+    # Follows a proven tree from the root, taking the fastest mate for the attacker
+    # and the reply that holds out the longest for the defender
+    def getLine(self, root):
+        line = []
+        node = root
+        while node.children:
+            if node.isAttackerTurn():
+                node = min((child for child in node.children if child.proof == 0), key=self.mateLength)
+            else:
+                node = max(node.children, key=self.mateLength)
+            line.append(node.move)
+        return line
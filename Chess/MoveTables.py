@@ -0,0 +1,94 @@
+'''
+Name: Caleb Appiagyei
+
+Date: 10/19/26
+
+Description: Precomputed move tables for every square on the board. The knight,
+king and pawn targets, the rays a sliding piece can travel along and the
+between/line tables used for pins are all built once when the module is
+imported so the move functions do not have to redo the bounds checks every call
+
+Inspiration: Eddie Sharick (Youtube)
+'''
+
+DIMENSION = 8 # Chess board is 8x8
+
+# Directions are (row change, coloumn change)
+knightJumps = ((-2, 1), (-1, 2), (1, 2), (2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1))
+kingSteps = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+rookDirections = ((-1, 0), (1, 0), (0, -1), (0, 1)) # Up, down, left, right
+bishopDirections = ((-1, -1), (-1, 1), (1, -1), (1, 1)) # 4 diagonals
+queenDirections = rookDirections + bishopDirections
+
+# Checks if the coordinate (r, c) is on the board
+def onBoard(r, c):
+    return 0 <= r < DIMENSION and 0 <= c < DIMENSION
+
+# Every square one step (or jump) away from (row, colo) that is still on the board
+def buildStepTable(steps):
+    table = []
+    for row in range(DIMENSION):
+        tableRow = []
+        for colo in range(DIMENSION):
+            tableRow.append(tuple((row + dr, colo + dc) for dr, dc in steps if onBoard(row + dr, colo + dc)))
+        table.append(tableRow)
+    return table
+
+# For every square, the squares a slider passes through in each direction (closest square first)
+def buildRayTable(directions):
+    table = []
+    for row in range(DIMENSION):
+        tableRow = []
+        for colo in range(DIMENSION):
+            rays = []
+            for dr, dc in directions:
+                ray = []
+                r, c = row + dr, colo + dc
+                while onBoard(r, c):
+                    ray.append((r, c))
+                    r, c = r + dr, c + dc
+                if ray: # Leave out the directions that go straight off the board
+                    rays.append(tuple(ray))
+            tableRow.append(tuple(rays))
+        table.append(tableRow)
+    return table
+
+# Builds the between and line tables, both indexed by [square1][square2] where square = row * 8 + coloumn
+# between holds the squares strictly between the two squares, line holds every square on the
+# line running through both of them. Both are empty when the squares do not share a line
+def buildLineTables():
+    between = [[() for _ in range(DIMENSION * DIMENSION)] for _ in range(DIMENSION * DIMENSION)]
+    line = [[frozenset() for _ in range(DIMENSION * DIMENSION)] for _ in range(DIMENSION * DIMENSION)]
+    for row in range(DIMENSION):
+        for colo in range(DIMENSION):
+            start = row * DIMENSION + colo
+            for dr, dc in queenDirections:
+                # The whole line through the square (both directions)
+                fullLine = [(row, colo)]
+                for sign in (1, -1):
+                    r, c = row + dr * sign, colo + dc * sign
+                    while onBoard(r, c):
+                        fullLine.append((r, c))
+                        r, c = r + dr * sign, c + dc * sign
+                fullLine = frozenset(fullLine)
+                # Walking out along the ray, every square passed so far is between
+                passed = []
+                r, c = row + dr, colo + dc
+                while onBoard(r, c):
+                    end = r * DIMENSION + c
+                    between[start][end] = tuple(passed)
+                    line[start][end] = fullLine
+                    passed.append((r, c))
+                    r, c = r + dr, c + dc
+    return between, line
+
+knightMoves = buildStepTable(knightJumps)
+kingMoves = buildStepTable(kingSteps)
+# The squares a pawn of the given color attacks from (row, colo)
+pawnAttacks = {
+    'w' : buildStepTable(((-1, -1), (-1, 1))),
+    'b' : buildStepTable(((1, -1), (1, 1)))
+}
+rookRays = buildRayTable(rookDirections)
+bishopRays = buildRayTable(bishopDirections)
+betweenSquares, lineSquares = buildLineTables()